@@ -1,12 +1,48 @@
+import math
 import logging
 from scipy.stats import norm
 import numpy as np
 
 from robo.acquisition_functions.base_acquisition import BaseAcquisitionFunction
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 logger = logging.getLogger(__name__)
 
 
+def _expected_improvement_numpy(m, s, eta):
+    z = (eta - m) / s
+    # z * cdf + pdf can round to a tiny negative number far in the tail
+    return np.maximum(s * (z * norm.cdf(z) + norm.pdf(z)), 0.0)
+
+
+def _expected_improvement_loop(m, s, eta):
+    f = np.empty(m.shape[0])
+    for i in range(m.shape[0]):
+        z = (eta - m[i]) / s[i]
+        # erfc keeps the precision of the CDF in the lower tail, where 1 + erf(.) cancels
+        cdf = 0.5 * math.erfc(-z / math.sqrt(2.0))
+        pdf = math.exp(-0.5 * z * z) / math.sqrt(2.0 * math.pi)
+        f[i] = max(s[i] * (z * cdf + pdf), 0.0)
+    return f
+
+
+# Closed form of the expected improvement for the predictive means m and
+# standard deviations s (both np.ndarray(N,)) and the incumbent value eta.
+# If numba is available it is compiled to a loop, which avoids the temporary
+# arrays and the overhead of scipy.stats in the inner loop of the acquisition
+# function maximization. The loop is not parallelized: most calls come from
+# local searches with a single point, where starting threads costs more
+# than it saves.
+if numba is not None:
+    _expected_improvement = numba.njit(cache=True)(_expected_improvement_loop)
+else:
+    _expected_improvement = _expected_improvement_numpy
+
+
 class EI(BaseAcquisitionFunction):
 
     def __init__(self, model, par=0.0):
@@ -67,14 +103,21 @@ class EI(BaseAcquisitionFunction):
         s = np.sqrt(v)
 
         if (s == 0).any():
-            f = np.array([[0]])
+            # The expected improvement vanishes at points without uncertainty
+            f = np.zeros(m.shape)
+            uncertain = s != 0
+            f[uncertain] = _expected_improvement(np.ascontiguousarray(m[uncertain], dtype=np.float64),
+                                                 np.ascontiguousarray(s[uncertain], dtype=np.float64),
+                                                 float(eta - self.par))
             df = np.zeros((1, X.shape[1]))
 
         else:
-            z = (eta - m - self.par) / s
-            f = s * (z * norm.cdf(z) + norm.pdf(z))
+            f = _expected_improvement(np.ascontiguousarray(m, dtype=np.float64).ravel(),
+                                      np.ascontiguousarray(s, dtype=np.float64).ravel(),
+                                      float(eta - self.par)).reshape(m.shape)
 
             if derivative:
+                z = (eta - m - self.par) / s
                 dmdx, ds2dx = self.model.predictive_gradients(X)
                 dmdx = dmdx[0]
                 ds2dx = ds2dx[0][:, None]
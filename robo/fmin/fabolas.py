@@ -201,7 +201,7 @@ def fabolas(objective_function, lower, upper, s_min, s_max,
         s = int(s_max / float(subsets[it]))
 
         x = init_random_uniform(lower, upper, 1, rng)[0]
-        logger.info("Evaluate %s on subset size %d", str(x), s)
+        logger.info("Evaluate %s on subset size %d", x, s)
         st = time.time()
         func_val, cost = objective_function(x, s)
         time_func_eval.append(time.time() - st)
@@ -270,7 +270,7 @@ def fabolas(objective_function, lower, upper, s_min, s_max,
         logger.info("Optimization overhead was %f seconds", time_overhead[-1])
 
         # Evaluate the chosen configuration
-        logger.info("Evaluate candidate %s on subset size %f", str(new_x[:-1]), s)
+        logger.info("Evaluate candidate %s on subset size %f", new_x[:-1], s)
         start_time = time.time()
         new_y, new_c = objective_function(new_x[:-1], s)
         time_func_eval.append(time.time() - start_time)
@@ -171,7 +171,7 @@ def mtbo(objective_function, lower, upper, n_tasks=2, n_init=2, num_iterations=3
         # Draw random configuration and evaluate it just on the auxiliary task
         task = 0
         x = init_random_uniform(lower, upper, 1, rng)[0]
-        logger.info("Evaluate candidate %s", str(x))
+        logger.info("Evaluate candidate %s", x)
         st = time.time()
         func_val, cost = objective_function(x, task)
         time_func_eval.append(time.time() - st)
@@ -228,7 +228,7 @@ def mtbo(objective_function, lower, upper, n_tasks=2, n_init=2, num_iterations=3
                                                                         proj_value=1)
 
         incumbents.append(incumbent[:-1])
-        logger.info("Current incumbent %s with estimated performance %f", str(incumbent), incumbent_value)
+        logger.info("Current incumbent %s with estimated performance %f", incumbent, incumbent_value)
 
         # Maximize acquisition function
         acquisition_func.update(model_objective, model_cost)
@@ -240,7 +240,7 @@ def mtbo(objective_function, lower, upper, n_tasks=2, n_init=2, num_iterations=3
         logger.info("Optimization overhead was %f seconds", time_overhead[-1])
 
         # Evaluate the chosen configuration
-        logger.info("Evaluate candidate %s", str(new_x))
+        logger.info("Evaluate candidate %s", new_x)
         start_time = time.time()
         new_y, new_c = objective_function(new_x[:-1], new_x[-1])
         time_func_eval.append(time.time() - start_time)
@@ -270,7 +270,7 @@ def mtbo(objective_function, lower, upper, n_tasks=2, n_init=2, num_iterations=3
     incumbent, incumbent_value = projected_incumbent_estimation(model_objective,
                                                                 X[:, :-1],
                                                                 proj_value=n_tasks - 1)
-    logger.info("Final incumbent %s with estimated performance %f", str(incumbent), incumbent_value)
+    logger.info("Final incumbent %s with estimated performance %f", incumbent, incumbent_value)
 
     results = dict()
     results["x_opt"] = incumbent[:-1].tolist()
@@ -67,7 +67,7 @@ def random_search(objective_function, lower, upper, num_iterations=30, output_pa
         logger.info("Optimization overhead was %f seconds", time_overhead[-1])
 
         # Evaluate
-        logger.info("Evaluate candidate %s", str(new_x))
+        logger.info("Evaluate candidate %s", new_x)
         start_time = time.time()
         new_y = objective_function(new_x)
         time_func_evals.append(time.time() - start_time)
@@ -88,7 +88,7 @@ def random_search(objective_function, lower, upper, num_iterations=30, output_pa
         incumbents.append(incumbent)
         incumbents_values.append(incumbent_value)
 
-        logger.info("New incumbent %s with estimated performance %f", str(incumbent), incumbent_value)
+        logger.info("New incumbent %s with estimated performance %f", incumbent, incumbent_value)
 
         runtime.append(time.time() - time_start)
 
@@ -27,4 +27,4 @@ def init_random_uniform(lower, upper, n_points, rng=None):
 
     n_dims = lower.shape[0]
 
-    return np.array([rng.uniform(lower, upper, n_dims) for _ in range(n_points)])
+    return rng.uniform(lower, upper, size=(n_points, n_dims))
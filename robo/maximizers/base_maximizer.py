@@ -23,6 +23,8 @@ class BaseMaximizer(object):
         self.lower = lower
         self.upper = upper
         self.objective_func = objective_function
+        # Acquisition value of the point returned by the last call of maximize
+        self.best_value = None
         if rng is None:
             self.rng = np.random.RandomState(np.random.randint(10000))
         else:
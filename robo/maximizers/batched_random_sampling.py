@@ -0,0 +1,56 @@
+import numpy as np
+
+from robo.maximizers.base_maximizer import BaseMaximizer
+from robo.initial_design import init_random_uniform
+
+
+class BatchedRandomSampling(BaseMaximizer):
+
+    def __init__(self, objective_function, lower, upper, n_samples=100000, batch_size=10000, rng=None):
+        """
+        Samples a large number of candidates uniformly at random and returns the
+        point with the highest objective value. The candidates are evaluated in
+        batches, such that the model computes the predictions for a whole batch
+        with one call instead of point by point.
+
+        Parameters
+        ----------
+        objective_function: acquisition function
+            The acquisition function which will be maximized
+        lower: np.ndarray (D)
+            Lower bounds of the input space
+        upper: np.ndarray (D)
+            Upper bounds of the input space
+        n_samples: int
+            Number of candidates that are sampled
+        batch_size: int
+            Number of candidates that are evaluated with one call of the
+            acquisition function. Limits the memory of the kernel matrix
+            between the candidates and the training data.
+        rng: numpy.random.RandomState
+            Random number generator
+        """
+        self.n_samples = n_samples
+        self.batch_size = batch_size
+        super(BatchedRandomSampling, self).__init__(objective_function, lower, upper, rng)
+
+    def maximize(self):
+        """
+        Maximizes the given acquisition function.
+
+        Returns
+        -------
+        np.ndarray(D,)
+            Point with highest acquisition value.
+        """
+
+        X = init_random_uniform(self.lower, self.upper, self.n_samples, rng=self.rng)
+
+        y = np.zeros([self.n_samples])
+        for i in range(0, self.n_samples, self.batch_size):
+            y[i:i + self.batch_size] = np.ravel(self.objective_func(X[i:i + self.batch_size]))
+
+        best = y.argmax()
+        self.best_value = y[best]
+
+        return X[best]
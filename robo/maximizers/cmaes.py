@@ -82,6 +82,8 @@ class CMAES(BaseMaximizer):
         if res[0] is None:
             logging.error("CMA-ES did not find anything. \
                 Return random configuration instead.")
+            self.best_value = None
             return start_point
 
+        self.best_value = res[1]
         return res[0]
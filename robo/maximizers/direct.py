@@ -37,7 +37,7 @@ class Direct(BaseMaximizer):
 
     def _direct_acquisition_fkt_wrapper(self, acq_f):
         def _l(x, user_data):
-            return -acq_f(np.array([x])), 0
+            return -acq_f(x[np.newaxis, :]), 0
         return _l
 
     def maximize(self):
@@ -51,7 +51,7 @@ class Direct(BaseMaximizer):
 
         """
         if self.verbose:
-            x, _, _ = DIRECT.solve(self._direct_acquisition_fkt_wrapper(self.objective_func),
+            x, fmin, _ = DIRECT.solve(self._direct_acquisition_fkt_wrapper(self.objective_func),
                                l=[self.lower],
                                u=[self.upper],
                                maxT=self.n_iters,
@@ -62,11 +62,12 @@ class Direct(BaseMaximizer):
                 with os.fdopen(os.open(os.devnull, os.O_WRONLY), 'wb') as devnull:
                     sys.stdout.flush();
                     os.dup2(devnull.fileno(), fileno)  # redirect
-                    x, _, _ = DIRECT.solve(self._direct_acquisition_fkt_wrapper(self.objective_func),
+                    x, fmin, _ = DIRECT.solve(self._direct_acquisition_fkt_wrapper(self.objective_func),
                                            l=[self.lower],
                                            u=[self.upper],
                                            maxT=self.n_iters,
                                            maxf=self.n_func_evals)
                 sys.stdout.flush();
                 os.dup2(stdout.fileno(), fileno)  # restore
+        self.best_value = -fmin
         return x
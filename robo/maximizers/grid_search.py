@@ -39,10 +39,10 @@ class GridSearch(BaseMaximizer):
 
         x = np.linspace(self.lower[0], self.upper[0], self.resolution).reshape((self.resolution, 1, 1))
         # y = array(map(acquisition_fkt, x))
-        ys = np.zeros([self.resolution])
+        y = np.zeros([self.resolution])
         for i in range(self.resolution):
-            ys[i] = self.objective_func(x[i])
-        y = np.array(ys)
+            y[i] = self.objective_func(x[i])
         x_star = x[y.argmax()]
+        self.best_value = y.max()
 
         return x_star[0]
@@ -39,14 +39,16 @@ class RandomSampling(BaseMaximizer):
                                    int(self.n_samples * .7))
 
         # Put a Gaussian on the incumbent and sample from that
-        loc = self.objective_func.model.get_incumbent()[0],
+        loc = self.objective_func.model.get_incumbent()[0]
         scale = np.ones([self.lower.shape[0]]) * 0.1
-        rand_incs = np.array([np.clip(np.random.normal(loc, scale), self.lower, self.upper)[0]
-                              for _ in range(int(self.n_samples * 0.3))])
+        rand_incs = np.clip(np.random.normal(loc, scale, size=(int(self.n_samples * 0.3), self.lower.shape[0])),
+                            self.lower, self.upper)
 
         X = np.concatenate((rand, rand_incs), axis=0)
-        y = self.objective_func(X)
+        y = np.ravel(self.objective_func(X))
 
-        x_star = X[y.argmax()]
+        best = y.argmax()
+        x_star = X[best]
+        self.best_value = y[best]
 
         return x_star
@@ -7,11 +7,22 @@ from functools import partial
 from robo.maximizers.base_maximizer import BaseMaximizer
 from robo.initial_design import init_random_uniform
 
+try:
+    import greenlet
+except ImportError:
+    greenlet = None
+
+try:
+    from scipy.stats import qmc
+except ImportError:
+    qmc = None
+
 
 class SciPyOptimizer(BaseMaximizer):
 
     def __init__(self, objective_function, lower,
-                 upper, n_restarts=10, verbosity=False, rng=None):
+                 upper, n_restarts=10, verbosity=False,
+                 start_points="random", n_candidates=4096, rng=None):
         """
         Interface for scipy's L-BFGS-B implementation.
 
@@ -27,27 +38,140 @@ class SciPyOptimizer(BaseMaximizer):
             Determines how often the local search is repeated.
         verbosity: bool
             Show scipy output.
-
+        start_points: {"random", "sobol"}
+            How the start points of the local searches are chosen. "random" samples half of them
+            uniformly and half of them around the incumbent. "sobol" evaluates the acquisition
+            function on n_candidates points of a Sobol sequence and samples the start points
+            with a probability that increases with their acquisition value.
+        n_candidates: int
+            Number of Sobol points that are evaluated if start_points == "sobol"
+        rng: numpy.random.RandomState
+            Random number generator
         """
-        if rng is None:
-            self.rng = np.random.RandomState(np.random.randint(0, 10000))
+        if start_points not in ("random", "sobol"):
+            raise ValueError("'{}' is not a valid strategy to choose the start points".format(start_points))
+        if start_points == "sobol" and qmc is None:
+            raise ValueError("If you want to use Sobol start points you have to install the following dependencies:\n"
+                             "Scipy >= 1.7 (pip install --upgrade scipy)")
+
         self.n_restarts = n_restarts
         self.verbosity = verbosity
+        self.start_points = start_points
+        self.n_candidates = n_candidates
         super(SciPyOptimizer, self).__init__(objective_function,
-                                             lower, upper)
+                                             lower, upper, rng)
+        # The bounds are the same for all local searches
+        self.bounds = list(zip(self.lower, self.upper))
 
     def _acquisition_fkt_wrapper(self, x, acq_f):
 
         if np.any(np.isnan(x)):
             return sys.float_info.max
 
-        a = -acq_f(np.array([np.clip(x, self.lower, self.upper)]))[0]
+        a = -acq_f(np.clip(x, self.lower, self.upper)[np.newaxis, :])[0]
 
         if np.any(np.isinf(a)):
             return sys.float_info.max
         else:
             return a
 
+    def _batched_acquisition_fkt_wrapper(self, X, acq_f):
+
+        a = np.ones([X.shape[0]]) * sys.float_info.max
+
+        valid = ~np.any(np.isnan(X), axis=1)
+        if np.any(valid):
+            a_valid = -np.ravel(acq_f(np.clip(X[valid], self.lower, self.upper)))
+            a_valid[np.isinf(a_valid)] = sys.float_info.max
+            a[valid] = a_valid
+
+        return a
+
+    def _sobol_starts(self, n_starts):
+        """
+        Evaluates the acquisition function on a scrambled Sobol sequence with a
+        single call and samples n_starts of these points without replacement,
+        where a point is drawn with probability proportional to exp(z) and z is its
+        standardized acquisition value.
+
+        Parameters
+        ----------
+        n_starts: int
+            Number of start points
+
+        Returns
+        -------
+        np.ndarray(n_starts, D)
+            Start points for the local searches
+        """
+        sobol = qmc.Sobol(d=self.lower.shape[0], seed=self.rng.randint(2 ** 31))
+        m = int(np.ceil(np.log2(max(self.n_candidates, n_starts))))
+        candidates = qmc.scale(sobol.random_base2(m), self.lower, self.upper)
+
+        a = np.ravel(self.objective_func(candidates)).astype(float)
+        finite = np.isfinite(a)
+        if not np.any(finite) or np.std(a[finite]) == 0:
+            p = np.ones([a.shape[0]])
+        else:
+            a[~finite] = np.min(a[finite])
+            z = (a - np.mean(a)) / np.std(a)
+            p = np.exp(z - np.max(z))
+
+        idx = self.rng.choice(a.shape[0], n_starts, replace=False, p=p / np.sum(p))
+
+        return candidates[idx]
+
+    def _local_search(self, f, start):
+        return optimize.minimize(f, start, method='L-BFGS-B',
+                                 bounds=self.bounds,
+                                 options={"disp": self.verbosity})
+
+    def _batched_local_searches(self, starts):
+        """
+        Runs the local searches from all start points concurrently. Each
+        search lives in its own greenlet and hands the points it wants to
+        evaluate to the parent, which evaluates the points of all running
+        searches with a single call of the acquisition function.
+
+        Parameters
+        ----------
+        starts: np.ndarray(N, D)
+            Start points of the local searches
+
+        Returns
+        -------
+        list
+            scipy's optimization result of each local search
+        """
+        results = [None] * starts.shape[0]
+
+        def query(x):
+            return greenlet.getcurrent().parent.switch(np.array(x))
+
+        def run(i):
+            results[i] = self._local_search(query, starts[i])
+
+        searches = [greenlet.greenlet(partial(run, i)) for i in range(starts.shape[0])]
+
+        # Start all local searches, each one returns its first query point
+        queries = dict()
+        for i, search in enumerate(searches):
+            x = search.switch()
+            if not search.dead:
+                queries[i] = x
+
+        while len(queries) > 0:
+            idx = list(queries.keys())
+            a = self._batched_acquisition_fkt_wrapper(np.array([queries[i] for i in idx]),
+                                                      self.objective_func)
+            queries = dict()
+            for i, a_i in zip(idx, a):
+                x = searches[i].switch(a_i)
+                if not searches[i].dead:
+                    queries[i] = x
+
+        return results
+
     def maximize(self):
         """
         Maximizes the given acquisition function.
@@ -62,21 +186,25 @@ class SciPyOptimizer(BaseMaximizer):
 
         f = partial(self._acquisition_fkt_wrapper, acq_f=self.objective_func)
 
-        starts = init_random_uniform(self.lower, self.upper, int(self.n_restarts * 0.5))
-        rand_incs = np.array([np.random.normal(loc=self.objective_func.model.get_incumbent()[0],
-                                               scale=np.ones([self.lower.shape[0]]) * 0.5)
-                              for _ in range(int(self.n_restarts * 0.5))])
-        starts = np.append(starts, rand_incs, axis=0)
-
-        for start in starts:
-
-           res = optimize.minimize(f, start, method='L-BFGS-B',
-                                   bounds=list(zip(self.lower, self.upper)),
-                                   options={"disp": self.verbosity})
+        if self.start_points == "sobol":
+            starts = self._sobol_starts(self.n_restarts)
+        else:
+            starts = init_random_uniform(self.lower, self.upper, int(self.n_restarts * 0.5))
+            rand_incs = np.random.normal(loc=self.objective_func.model.get_incumbent()[0],
+                                         scale=np.ones([self.lower.shape[0]]) * 0.5,
+                                         size=(int(self.n_restarts * 0.5), self.lower.shape[0]))
+            starts = np.append(starts, rand_incs, axis=0)
+
+        if greenlet is not None:
+            results = self._batched_local_searches(starts)
+        else:
+            results = [self._local_search(f, start) for start in starts]
 
-           cand.append(res["x"])
-           cand_vals.append(res["fun"])
+        for res in results:
+            cand.append(res["x"])
+            cand_vals.append(res["fun"])
 
         best = np.argmin(cand_vals)
+        self.best_value = -cand_vals[best]
 
         return np.clip(cand[best], self.lower, self.upper)
@@ -78,6 +78,19 @@ class BaseModel(object):
 
         return func_wrapper
 
+    def get_hyperparameters(self):
+        """
+        Returns the current hyperparameters of the model. Override this function
+        if your model has hyperparameters.
+
+        Returns
+        ----------
+        np.ndarray or None
+            The hyperparameters or None if the model has no hyperparameters
+            or is not trained yet
+        """
+        return None
+
     def get_json_data(self):
         """
         Json getter function'
@@ -86,9 +99,10 @@ class BaseModel(object):
         ----------
             dictionary
         """
+        hypers = self.get_hyperparameters()
         json_data = {'X': self.X if self.X is None else self.X.tolist(),
                      'y': self.y if self.y is None else self.y.tolist(),
-                     'hyperparameters': ""}
+                     'hyperparameters': "" if hypers is None else np.asarray(hypers).tolist()}
         return json_data
 
     def get_incumbent(self):
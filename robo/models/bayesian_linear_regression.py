@@ -199,7 +199,7 @@ class BayesianLinearRegression(BaseModel):
             alpha = sample[0]
             beta = sample[1]
 
-            logger.debug("Alpha=%f ; Beta=%f" % (alpha, beta))
+            logger.debug("Alpha=%f ; Beta=%f", alpha, beta)
 
             S_inv = beta * np.dot(self.X_transformed.T, self.X_transformed)
             S_inv += np.eye(self.X_transformed.shape[1]) * alpha
@@ -192,7 +192,7 @@ class BayesianNeuralNetwork(BaseModel):
         elif self.sampling_method == "sgld":
             self.sampler = SGLDSampler(rng=srng, precondition=self.precondition)
         else:
-            logging.error("Sampling Strategy % does not exist!" % self.sampling_method)
+            logging.error("Sampling Strategy %s does not exist!", self.sampling_method)
 
         self.compute_err = theano.function([self.Xt, self.Yt], [mse, nll])
         self.single_predict = theano.function([self.Xt], lasagne.layers.get_output(self.net, self.Xt))
@@ -219,7 +219,7 @@ class BayesianNeuralNetwork(BaseModel):
         if self.X.shape[0] < self.bsize:
             self.bsize = self.X.shape[0]
             logging.error("Not enough datapoint to form a minibatch. "
-                          "Set the batchsize to {}".format(self.bsize))
+                          "Set the batchsize to %d", self.bsize)
 
         i = 0
         while i < self.n_iters and len(self.samples) < self.n_nets:
@@ -239,19 +239,18 @@ class BayesianNeuralNetwork(BaseModel):
             if i % 512 == 0 and i <= self.burn_in:
                 total_err, total_nll = self.compute_err(floatX(self.X), floatX(self.y).reshape(-1, 1))
                 t = time.time() - start_time
-                logging.info("Iter {:8d} : NLL = {:11.4e} MSE = {:.4e} "
-                             "Time = {:5.2f}".format(i, float(total_nll),
-                             float(total_err), t))
+                logging.info("Iter %8d : NLL = %11.4e MSE = %.4e "
+                             "Time = %5.2f", i, float(total_nll),
+                             float(total_err), t)
 
             if i % self.sample_steps == 0 and i >= self.burn_in:
                 total_err, total_nll = self.compute_err(floatX(self.X), floatX(self.y).reshape(-1, 1))
                 t = time.time() - start_time
                 self.samples.append(lasagne.layers.get_all_param_values(self.net))
-                logging.info("Iter {:8d} : NLL = {:11.4e} MSE = {:.4e} "
-                             "Samples= {} Time = {:5.2f}".format(i,
-                                                                      float(total_nll),
-                                                                      float(total_err),
-                                                                      len(self.samples), t))
+                logging.info("Iter %8d : NLL = %11.4e MSE = %.4e "
+                             "Samples= %d Time = %5.2f", i,
+                             float(total_nll), float(total_err),
+                             len(self.samples), t)
             i += 1
         self.is_trained = True
 
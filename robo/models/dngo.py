@@ -233,12 +233,12 @@ class DNGO(BaseModel):
                 train_batches += 1
 
             lc[epoch] = train_err / train_batches
-            logging.debug("Epoch {} of {}".format(epoch + 1, self.num_epochs))
+            logging.debug("Epoch %d of %d", epoch + 1, self.num_epochs)
             curtime = time.time()
             epoch_time = curtime - epoch_start_time
             total_time = curtime - start_time
-            logging.debug("Epoch time {:.3f}s, total time {:.3f}s".format(epoch_time, total_time))
-            logging.debug("Training loss:\t\t{:.5g}".format(train_err / train_batches))
+            logging.debug("Epoch time %.3fs, total time %.3fs", epoch_time, total_time)
+            logging.debug("Training loss:\t\t%.5g", train_err / train_batches)
 
             # Adapt the learning rate
             if epoch % self.adapt_epoch == 0:
@@ -284,7 +284,7 @@ class DNGO(BaseModel):
 
             self.hypers = [[self.alpha, self.beta]]
 
-        logging.info("Hypers: %s" % self.hypers)
+        logging.info("Hypers: %s", self.hypers)
         self.models = []
         for sample in self.hypers:
 
@@ -113,7 +113,7 @@ class GaussianProcess(BaseModel):
             self.hypers = self.gp.kernel[:]
             self.hypers = np.append(self.hypers, np.log(self.noise))
 
-        logger.debug("GP Hyperparameters: " + str(self.hypers))
+        logger.debug("GP Hyperparameters: %s", self.hypers)
 
         try:
             self.gp.compute(self.X, yerr=np.sqrt(self.noise))
@@ -331,6 +331,19 @@ class GaussianProcess(BaseModel):
         else:
             return funcs
         
+    def get_hyperparameters(self):
+        """
+        Returns the current hyperparameters of the model
+
+        Returns
+        ----------
+        np.ndarray(H) or None
+            The hyperparameters (on a log scale) or None if the model is not trained yet
+        """
+        if not self.is_trained:
+            return None
+        return np.array(self.hypers)
+
     def get_incumbent(self):
         """
         Returns the best observed point and its function value
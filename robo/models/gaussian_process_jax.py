@@ -0,0 +1,406 @@
+import logging
+import numpy as np
+
+from scipy import optimize
+from scipy import linalg
+
+try:
+    import jax
+    import jax.numpy as jnp
+    import jax.scipy.linalg as jspla
+except ImportError:
+    raise ValueError("If you want to use the JAX Gaussian process you have to install the following dependencies:\n"
+                     "JAX (pip install jax)")
+
+from robo.util import normalization
+from robo.models.base_model import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def _matern52(theta, X1, X2, xp=np):
+    """
+    Matern 5/2 kernel with the same parametrization as
+    george's ConstantKernel * Matern52Kernel, i.e. theta[0] is the log
+    covariance amplitude and theta[1:-1] are the log squared length scales.
+    The last entry of theta (the noise) is ignored.
+
+    Parameters
+    ----------
+    theta : np.ndarray(D + 2)
+        Hyperparameter vector on a log scale
+    X1 : np.ndarray(N, D)
+    X2 : np.ndarray(M, D)
+    xp : module
+        Either numpy or jax.numpy
+
+    Returns
+    ----------
+    np.ndarray(N, M)
+        The kernel matrix between X1 and X2
+    """
+    amp = xp.exp(theta[0])
+    ls = xp.exp(theta[1:-1])
+    # Expand |a - b|^2 = |a|^2 + |b|^2 - 2ab on the scaled inputs, which avoids an
+    # (N, M, D) temporary. Rounding can make the result slightly negative.
+    A = X1 / xp.sqrt(ls)
+    B = X2 / xp.sqrt(ls)
+    r2 = xp.sum(A ** 2, axis=1)[:, None] + xp.sum(B ** 2, axis=1)[None, :] - 2 * xp.dot(A, B.T)
+    r2 = xp.maximum(r2, 0)
+    # Keep the gradient of the square root finite on the diagonal
+    r = xp.sqrt(xp.maximum(r2, 1e-36))
+    return amp * (1 + np.sqrt(5) * r + 5. / 3. * r2) * xp.exp(-np.sqrt(5) * r)
+
+
+def _neg_log_likelihood(theta, X, y, mask):
+    """
+    Negative marginal log likelihood of a GP with a Matern 5/2 kernel. The
+    data are padded to a fixed size to avoid recompiling the function for
+    every new data point. Padded points (mask == 0) get an identity block in
+    the kernel matrix and a zero target and do not change the likelihood.
+    """
+    K = _matern52(theta, X, X, xp=jnp) * mask[:, None] * mask[None, :]
+    K = K + jnp.diag(mask * jnp.exp(theta[-1]) + (1 - mask))
+
+    L = jnp.linalg.cholesky(K)
+    alpha = jspla.cho_solve((L, True), y)
+
+    n = jnp.sum(mask)
+    return 0.5 * jnp.dot(y, alpha) + jnp.sum(jnp.log(jnp.diag(L))) + 0.5 * n * np.log(2 * np.pi)
+
+
+# Has to be called inside of jax.enable_x64(True), since the Cholesky
+# decomposition of the kernel matrix is not stable in single precision
+_nll_and_grad = jax.jit(jax.value_and_grad(_neg_log_likelihood))
+
+
+class GaussianProcessJax(BaseModel):
+
+    def __init__(self, lengthscales, cov_amp=1.0, prior=None,
+                 noise=1e-3, use_prior_gradient=False,
+                 normalize_output=False,
+                 normalize_input=True,
+                 lower=None, upper=None, rng=None):
+        """
+        Gaussian process with a Matern 5/2 kernel whose marginal log likelihood and
+        its gradient are computed by JAX. The GP hyperparameters are obtained by
+        optimizing the marginal log likelihood with L-BFGS-B. The model has the same
+        interface and hyperparameter layout as GaussianProcess, such that the same
+        priors, acquisition functions and solvers can be used.
+
+        Parameters
+        ----------
+        lengthscales : np.ndarray(D,)
+            Initial squared length scales of the kernel (the metric of george's Matern52Kernel)
+        cov_amp : float
+            Initial covariance amplitude of the kernel
+        prior : prior object
+            Defines a prior for the hyperparameters of the GP. Make sure that
+            it implements the Prior interface.
+        noise : float
+            Noise term that is added to the diagonal of the covariance matrix
+            for the Cholesky decomposition.
+        use_prior_gradient : bool
+            Use the gradient method of the prior. Most priors do not implement their
+            gradient, hence by default it is approximated by finite differences of lnprob.
+        normalize_output : bool
+            Zero mean unit variance normalization of the output values
+        normalize_input : bool
+            Normalize all inputs to be in [0, 1]. This is important to define good priors for the
+            length scales.
+        lower : np.array(D,)
+            Lower bound of the input space which is used for the input space normalization
+        upper : np.array(D,)
+            Upper bound of the input space which is used for the input space normalization
+        rng: np.random.RandomState
+            Random number generator
+        """
+
+        if rng is None:
+            self.rng = np.random.RandomState(np.random.randint(0, 10000))
+        else:
+            self.rng = rng
+
+        self.prior = prior
+        self.noise = noise
+        self.use_prior_gradient = use_prior_gradient
+        self.normalize_output = normalize_output
+        self.normalize_input = normalize_input
+        self.X = None
+        self.y = None
+        self.hypers = np.concatenate(([np.log(cov_amp)], np.log(lengthscales), [np.log(noise)]))
+        self.is_trained = False
+        self.lower = lower
+        self.upper = upper
+
+    @BaseModel._check_shapes_train
+    def train(self, X, y, do_optimize=True):
+        """
+        Computes the Cholesky decomposition of the covariance of X and
+        estimates the GP hyperparameters by optimizing the marginal
+        loglikelihood. The prior mean of the GP is set to the empirical
+        mean of X.
+
+        Parameters
+        ----------
+        X: np.ndarray (N, D)
+            Input data points. The dimensionality of X is (N, D),
+            with N as the number of points and D is the number of features.
+        y: np.ndarray (N,)
+            The corresponding target values.
+        do_optimize: boolean
+            If set to true the hyperparameters are optimized otherwise
+            the current hyperparameters are used.
+        """
+
+        if self.normalize_input:
+            # Normalize input to be in [0, 1]
+            self.X, self.lower, self.upper = normalization.zero_one_normalization(X, self.lower, self.upper)
+        else:
+            self.X = X
+
+        if self.normalize_output:
+            # Normalize output to have zero mean and unit standard deviation
+            self.y, self.y_mean, self.y_std = normalization.zero_mean_unit_var_normalization(y)
+            if self.y_std == 0:
+                raise ValueError("Cannot normalize output. All targets have the same value")
+        else:
+            self.y = y
+
+        # Use the empirical mean of the data as mean for the GP
+        self.mean = np.mean(self.y, axis=0)
+
+        self._X_pad, self._y_pad, self._mask = self._padded_data()
+
+        if do_optimize:
+            self.hypers = self.optimize()
+        self.noise = np.exp(self.hypers[-1])  # sigma^2
+
+        logger.debug("GP Hyperparameters: %s", self.hypers)
+
+        K = _matern52(self.hypers, self.X, self.X)
+        try:
+            self.L = linalg.cholesky(K + self.noise * np.eye(self.X.shape[0]), lower=True)
+        except np.linalg.LinAlgError:
+            self.noise *= 10
+            self.L = linalg.cholesky(K + self.noise * np.eye(self.X.shape[0]), lower=True)
+        self.alpha = linalg.cho_solve((self.L, True), self.y - self.mean)
+
+        self.is_trained = True
+
+    def get_noise(self):
+        return self.noise
+
+    def _padded_data(self):
+        # Pad the data to the next power of two, such that JAX compiles the
+        # likelihood only O(log N) times during a run
+        n = self.X.shape[0]
+        n_pad = int(2 ** np.ceil(np.log2(n)))
+        X = np.zeros([n_pad, self.X.shape[1]])
+        X[:n] = self.X
+        y = np.zeros([n_pad])
+        y[:n] = self.y - self.mean
+        mask = np.zeros([n_pad])
+        mask[:n] = 1
+        return X, y, mask
+
+    def nll(self, theta):
+        """
+        Returns the negative marginal log likelihood (+ the prior) for
+        a hyperparameter configuration theta and its gradient.
+        (negative because we use scipy minimize for optimization)
+
+        Parameters
+        ----------
+        theta : np.ndarray(H)
+            Hyperparameter vector. Note that all hyperparameter are
+            on a log scale.
+
+        Returns
+        ----------
+        float
+            lnlikelihood + prior
+        np.ndarray(H)
+            gradient of lnlikelihood + prior with respect to theta
+        """
+        # Specify bounds to keep things sane
+        if np.any((-20 > theta) + (theta > 20)):
+            return 1e25, np.zeros(theta.shape)
+
+        with jax.enable_x64(True):
+            nll, grad = _nll_and_grad(theta, self._X_pad, self._y_pad, self._mask)
+            nll = float(nll)
+            grad = np.asarray(grad)
+
+        # Add prior
+        if self.prior is not None:
+            lnprob = self.prior.lnprob(theta)
+            if not np.isfinite(lnprob):
+                return 1e25, np.zeros(theta.shape)
+            nll -= lnprob
+            if self.use_prior_gradient:
+                grad = grad - self.prior.gradient(theta)
+            else:
+                grad = grad - optimize.approx_fprime(theta, self.prior.lnprob, 1e-8)
+
+        if not np.isfinite(nll) or not np.all(np.isfinite(grad)):
+            return 1e25, np.zeros(theta.shape)
+        return nll, grad
+
+    def optimize(self):
+        """
+        Optimizes the marginal log likelihood and returns the best found
+        hyperparameter configuration theta.
+
+        Returns
+        -------
+        theta : np.ndarray(H)
+            Hyperparameter vector that maximizes the marginal log likelihood
+        """
+        # Start optimization from the previous hyperparameter configuration
+        p0 = np.array(self.hypers)
+
+        try:
+            results = optimize.minimize(self.nll, p0, jac=True, method='L-BFGS-B')
+            theta = results.x
+        except ValueError:
+            logging.error("Could not find a valid hyperparameter configuration! Use initial configuration")
+            theta = p0
+
+        return theta
+
+    def predict_variance(self, x1, X2):
+        r"""
+        Predicts the variance between a test points x1 and a set of points X2 by
+           math: \sigma(X_1, X_2) = k_{X_1,X_2} - k_{X_1,X} * (K_{X,X}
+                       + \sigma^2*\mathds{I})^-1 * k_{X,X_2})
+
+        Parameters
+        ----------
+        x1: np.ndarray (1, D)
+            First test point
+        X2: np.ndarray (N, D)
+            Set of test point
+        Returns
+        ----------
+        np.array(N, 1)
+            predictive variance between x1 and X2
+
+        """
+
+        if not self.is_trained:
+            raise Exception('Model has to be trained first!')
+
+        x_ = np.concatenate((x1, X2))
+        _, var = self.predict(x_, full_cov=True)
+
+        var = var[-1, :-1, np.newaxis]
+
+        return var
+
+    @BaseModel._check_shapes_predict
+    def predict(self, X_test, full_cov=False, **kwargs):
+        r"""
+        Returns the predictive mean and variance of the objective function at
+        the given test points.
+
+        Parameters
+        ----------
+        X_test: np.ndarray (N, D)
+            Input test points
+        full_cov: bool
+            If set to true than the whole covariance matrix between the test points is returned
+
+        Returns
+        ----------
+        np.array(N,)
+            predictive mean
+        np.array(N,) or np.array(N, N) if full_cov == True
+            predictive variance
+
+        """
+
+        if not self.is_trained:
+            raise Exception('Model has to be trained first!')
+
+        if self.normalize_input:
+            X_test_norm, _, _ = normalization.zero_one_normalization(X_test, self.lower, self.upper)
+        else:
+            X_test_norm = X_test
+
+        K_zx = _matern52(self.hypers, X_test_norm, self.X)
+        mu = np.dot(K_zx, self.alpha) + self.mean
+
+        v = linalg.solve_triangular(self.L, K_zx.T, lower=True)
+        if full_cov:
+            var = _matern52(self.hypers, X_test_norm, X_test_norm) - np.dot(v.T, v)
+        else:
+            var = np.exp(self.hypers[0]) - np.sum(v ** 2, axis=0)
+
+        if self.normalize_output:
+            mu = normalization.zero_mean_unit_var_unnormalization(mu, self.y_mean, self.y_std)
+            var *= self.y_std ** 2
+
+        # Clip negative variances and set them to the smallest
+        # positive float value
+        if full_cov:
+            np.fill_diagonal(var, np.clip(np.diag(var), np.finfo(var.dtype).eps, np.inf))
+        else:
+            var = np.clip(var, np.finfo(var.dtype).eps, np.inf)
+
+        return mu, var
+
+    def sample_functions(self, X_test, n_funcs=1):
+        """
+        Samples F function values from the current posterior at the N
+        specified test points.
+
+        Parameters
+        ----------
+        X_test: np.ndarray (N, D)
+            Input test points
+        n_funcs: int
+            Number of function values that are drawn at each test point.
+
+        Returns
+        ----------
+        function_samples: np.array(F, N)
+            The F function values drawn at the N test points.
+        """
+
+        mu, var = self.predict(X_test, full_cov=True)
+
+        return self.rng.multivariate_normal(mu, var, n_funcs)
+
+    def get_hyperparameters(self):
+        """
+        Returns the current hyperparameters of the model
+
+        Returns
+        ----------
+        np.ndarray(H) or None
+            The hyperparameters (on a log scale) or None if the model is not trained yet
+        """
+        if not self.is_trained:
+            return None
+        return np.array(self.hypers)
+
+    def get_incumbent(self):
+        """
+        Returns the best observed point and its function value
+
+        Returns
+        ----------
+        incumbent: ndarray (D,)
+            current incumbent
+        incumbent_value: ndarray (N,)
+            the observed value of the incumbent
+        """
+        inc, inc_value = super(GaussianProcessJax, self).get_incumbent()
+        if self.normalize_input:
+            inc = normalization.zero_one_unnormalization(inc, self.lower, self.upper)
+
+        if self.normalize_output:
+            inc_value = normalization.zero_mean_unit_var_unnormalization(inc_value, self.y_mean, self.y_std)
+
+        return inc, inc_value
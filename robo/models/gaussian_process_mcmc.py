@@ -249,6 +249,19 @@ class GaussianProcessMCMC(BaseModel):
 
         return m, v
 
+    def get_hyperparameters(self):
+        """
+        Returns the current hyperparameters of the model
+
+        Returns
+        ----------
+        np.ndarray(S, H) or None
+            The S hyperparameter samples (on a log scale) or None if the model is not trained yet
+        """
+        if not self.is_trained:
+            return None
+        return np.array(self.hypers)
+
     def get_incumbent(self):
         """
         Returns the best observed point and its function value
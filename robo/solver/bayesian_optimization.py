@@ -1,9 +1,13 @@
 import os
 import time
 import json
+import types
 import logging
+import multiprocessing
 import numpy as np
 
+from functools import partial
+
 from robo.initial_design.init_random_uniform import init_random_uniform
 from robo.solver.base_solver import BaseSolver
 
@@ -11,6 +15,54 @@ from robo.solver.base_solver import BaseSolver
 logger = logging.getLogger(__name__)
 
 
+def _reseed(obj, rng):
+    """
+    Reseeds all np.random.RandomState objects that are reachable from obj, including
+    the ones of nested components such as the prior of a model. Each generator gets
+    its own seed that is drawn from rng.
+    """
+    visited = set()
+    stack = [obj]
+    while len(stack) > 0:
+        obj = stack.pop()
+        if id(obj) in visited:
+            continue
+        visited.add(id(obj))
+
+        if isinstance(obj, np.random.RandomState):
+            obj.seed(rng.randint(2 ** 31))
+        elif isinstance(obj, dict):
+            stack.extend(reversed(list(obj.values())))
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(reversed(obj))
+        elif hasattr(obj, "__dict__") and not isinstance(obj, (type, types.ModuleType)):
+            stack.extend(reversed(list(vars(obj).values())))
+
+
+def _run_one(seed, solver_cls, kwargs, num_iterations):
+    """
+    Runs Bayesian optimization with a given seed. Used by BayesianOptimization.run_parallel.
+    """
+    np.random.seed(seed)
+
+    # Each process gets its own copy of the components with the same state of their
+    # random number generators, reseed them so that the runs with different seeds are independent
+    rng = np.random.RandomState(seed)
+    _reseed(kwargs, rng)
+
+    bo = solver_cls(rng=rng, **kwargs)
+    x_best, f_min = bo.run(num_iterations)
+
+    results = dict()
+    results["x_opt"] = x_best
+    results["f_opt"] = f_min
+    results["incumbents"] = bo.incumbents
+    results["incumbent_values"] = bo.incumbents_values
+    results["runtime"] = bo.runtime
+    results["overhead"] = bo.time_overhead
+    return results
+
+
 class BayesianOptimization(BaseSolver):
 
     def __init__(self, objective_func, lower, upper,
@@ -20,6 +72,8 @@ class BayesianOptimization(BaseSolver):
                  output_path=None,
                  train_interval=1,
                  n_restarts=1,
+                 use_float32=False,
+                 duplicate_threshold=1e-8,
                  rng=None):
         """
         Implementation of the standard Bayesian optimization loop that uses
@@ -36,7 +90,9 @@ class BayesianOptimization(BaseSolver):
             Model (i.e. GaussianProcess, RandomForest) that models our current
             believe of the objective function.
         objective_func:
-            Function handle for the objective function
+            Function handle for the objective function. If it has an attribute
+            supports_batch that is set to True, all points of the initial design are
+            evaluated with a single call that maps np.ndarray(N,D) to np.ndarray(N,).
         output_path: string
             Specifies the path where the intermediate output after each iteration will be saved.
             If None no output will be saved to disk.
@@ -51,6 +107,16 @@ class BayesianOptimization(BaseSolver):
             Specifies after how many iterations the model is retrained.
         n_restarts: int
             How often the incumbent estimation is repeated.
+        use_float32: bool
+            Store the evaluated points and their function values in single precision,
+            which halves the memory of the stored observations. The model is still
+            trained in double precision on a copy that is created in each iteration,
+            so the peak memory is not reduced, and the model sees the rounded points.
+            The incumbents are kept in double precision.
+        duplicate_threshold: float
+            If the last evaluated point has a Euclidean distance smaller than this
+            to one of the previous points, the hyperparameters of the model are
+            not optimized in the next iteration, since the data did barely change.
         rng: np.random.RandomState
             Random number generator
         """
@@ -63,11 +129,17 @@ class BayesianOptimization(BaseSolver):
         self.model = model
         self.acquisition_func = acquisition_func
         self.maximize_func = maximize_func
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.initial_design = initial_design
         self.objective_func = objective_func
         self.X = None
         self.y = None
+        self._n_observed = 0
+        # The incumbent in double precision, even if the observations are stored in single precision
+        self._best_x = None
+        self._best_y = np.inf
+        # Acquisition value of the last point returned by choose_next, None if it was chosen at random
+        self._acquisition_value = None
         self.time_func_evals = []
         self.time_overhead = []
         self.train_interval = train_interval
@@ -79,6 +151,8 @@ class BayesianOptimization(BaseSolver):
         self.incumbents = []
         self.incumbents_values = []
         self.n_restarts = n_restarts
+        self.dtype = np.float32 if use_float32 else np.float64
+        self.duplicate_threshold = duplicate_threshold
         self.init_points = initial_points
         self.runtime = []
 
@@ -107,92 +181,128 @@ class BayesianOptimization(BaseSolver):
 
         if X is None and y is None:
 
-            # Initial design
-            X = []
-            y = []
+            # Allocate the memory for all points once, instead of growing
+            # the arrays in every iteration
+            n_points = max(num_iterations, self.init_points)
+            self.X = np.zeros([n_points, self.lower.shape[0]], dtype=self.dtype)
+            self.y = np.zeros([n_points], dtype=self.dtype)
+            self._n_observed = 0
+            self._best_x = None
+            self._best_y = np.inf
+            self._acquisition_value = None
 
-            start_time_overhead = time.time()
+            # Initial design
+            start_time_overhead = time.perf_counter()
             init = self.initial_design(self.lower,
                                        self.upper,
                                        self.init_points,
                                        rng=self.rng)
-            time_overhead = (time.time() - start_time_overhead) / self.init_points
+            time_overhead = (time.perf_counter() - start_time_overhead) / self.init_points
 
-            for i, x in enumerate(init):
+            evaluate_batch = getattr(self.objective_func, "supports_batch", False)
+            if evaluate_batch:
+                logger.info("Evaluate: %s", init)
 
-                logger.info("Evaluate: %s", x)
+                start_time = time.perf_counter()
+                init_y = np.ravel(self.objective_func(init))
+                time_func_eval = (time.perf_counter() - start_time) / self.init_points
 
-                start_time = time.time()
-                new_y = self.objective_func(x)
+                if init_y.shape[0] != init.shape[0]:
+                    raise ValueError("The objective function returned {} values for a batch of {} points"
+                                     .format(init_y.shape[0], init.shape[0]))
+
+            for i, x in enumerate(init):
 
-                X.append(x)
-                y.append(new_y)
-                self.time_func_evals.append(time.time() - start_time)
+                if evaluate_batch:
+                    new_y = float(init_y[i])
+                else:
+                    logger.info("Evaluate: %s", x)
+
+                    start_time = time.perf_counter()
+                    # The objective may return a scalar or an array with a single entry
+                    new_y = np.asarray(self.objective_func(x)).item()
+                    time_func_eval = time.perf_counter() - start_time
+
+                self.X[i] = x
+                self.y[i] = new_y
+                self._n_observed = i + 1
+                if self._best_x is None or new_y < self._best_y:
+                    self._best_x = np.array(x, dtype=np.float64)
+                    self._best_y = new_y
+                self.time_func_evals.append(time_func_eval)
                 self.time_overhead.append(time_overhead)
 
                 logger.info("Configuration achieved a performance of %f in %f seconds",
-                            y[i], self.time_func_evals[i])
+                            self.y[i], self.time_func_evals[i])
 
                 # Use best point seen so far as incumbent
-                best_idx = np.argmin(y)
-                incumbent = X[best_idx]
-                incumbent_value = y[best_idx]
+                incumbent = self._best_x.tolist()
+                incumbent_value = self._best_y
 
-                self.incumbents.append(incumbent.tolist())
+                self.incumbents.append(incumbent)
                 self.incumbents_values.append(incumbent_value)
 
-                self.runtime.append(time.time() - self.start_time)
+                self.runtime.append(time.perf_counter() - self.start_time)
 
                 if self.output_path is not None:
                     self.save_output(i)
-
-            self.X = np.array(X)
-            self.y = np.array(y)
         else:
-            self.X = X
-            self.y = y
+            n_points = X.shape[0] + max(num_iterations - self.init_points, 0)
+            self.X = np.zeros([n_points, X.shape[1]], dtype=self.dtype)
+            self.y = np.zeros([n_points], dtype=self.dtype)
+            self.X[:X.shape[0]] = X
+            self.y[:X.shape[0]] = np.ravel(y)
+            self._n_observed = X.shape[0]
+            best = np.argmin(np.ravel(y))
+            self._best_x = np.array(X[best], dtype=np.float64)
+            self._best_y = float(np.ravel(y)[best])
 
         # Main Bayesian optimization loop
         for it in range(self.init_points, num_iterations):
             logger.info("Start iteration %d ... ", it)
 
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             if it % self.train_interval == 0:
-                do_optimize = True
+                do_optimize = not self._last_point_is_duplicate()
             else:
                 do_optimize = False
 
             # Choose next point to evaluate
-            new_x = self.choose_next(self.X, self.y, do_optimize)
+            new_x = self.choose_next(self.X[:self._n_observed],
+                                     self.y[:self._n_observed], do_optimize)
 
-            self.time_overhead.append(time.time() - start_time)
+            # The overhead ends where the function evaluation starts
+            start_time_eval = time.perf_counter()
+            self.time_overhead.append(start_time_eval - start_time)
             logger.info("Optimization overhead was %f seconds", self.time_overhead[-1])
-            logger.info("Next candidate %s", str(new_x))
+            logger.info("Next candidate %s", new_x)
 
             # Evaluate
-            start_time = time.time()
-            new_y = self.objective_func(new_x)
-            self.time_func_evals.append(time.time() - start_time)
+            new_y = np.asarray(self.objective_func(new_x)).item()
+            self.time_func_evals.append(time.perf_counter() - start_time_eval)
 
             logger.info("Configuration achieved a performance of %f ", new_y)
             logger.info("Evaluation of this configuration took %f seconds", self.time_func_evals[-1])
 
             # Extend the data
-            self.X = np.append(self.X, new_x[None, :], axis=0)
-            self.y = np.append(self.y, new_y)
-
-            # Estimate incumbent
-            best_idx = np.argmin(self.y)
-            incumbent = self.X[best_idx]
-            incumbent_value = self.y[best_idx]
-
-            self.incumbents.append(incumbent.tolist())
+            self.X[self._n_observed] = new_x
+            self.y[self._n_observed] = new_y
+            if new_y < self._best_y:
+                self._best_x = np.array(new_x, dtype=np.float64)
+                self._best_y = new_y
+            self._n_observed += 1
+
+            # The incumbent can only change if the new point improved on it
+            incumbent = self._best_x.tolist()
+            incumbent_value = self._best_y
+
+            self.incumbents.append(incumbent)
             self.incumbents_values.append(incumbent_value)
             logger.info("Current incumbent %s with estimated performance %f",
-                        str(incumbent), incumbent_value)
+                        incumbent, incumbent_value)
 
-            self.runtime.append(time.time() - self.start_time)
+            self.runtime.append(time.perf_counter() - self.start_time)
 
             if self.output_path is not None:
                 self.save_output(it)
@@ -202,6 +312,64 @@ class BayesianOptimization(BaseSolver):
 
         return self.incumbents[-1], self.incumbents_values[-1]
 
+    def _last_point_is_duplicate(self):
+        """
+        Checks if the last evaluated point is (almost) identical to one of the
+        points that were evaluated before.
+
+        Returns
+        -------
+        bool
+        """
+        if self._n_observed < 2:
+            return False
+
+        X = self.X[:self._n_observed - 1]
+        x = self.X[self._n_observed - 1]
+        dist = np.min(np.linalg.norm(X - x, axis=1))
+
+        if dist < self.duplicate_threshold:
+            logger.info("Last point is a duplicate, skip the optimization of the hyperparameters")
+            return True
+        return False
+
+    @classmethod
+    def run_parallel(cls, n_seeds, num_iterations, kwargs, n_jobs=None):
+        """
+        Runs independent Bayesian optimization runs for the seeds 0, ..., n_seeds - 1
+        in parallel processes.
+
+        Parameters
+        ----------
+        n_seeds: int
+            The number of independent runs
+        num_iterations: int
+            The number of iterations of each run
+        kwargs: dict
+            Keyword arguments for the constructor of the solver (except rng).
+            All entries have to be picklable, in particular the objective function.
+            The processes are started with the spawn method, hence functions and classes
+            have to be defined in a module that the processes can import.
+        n_jobs: int
+            The number of processes. If None, the number of CPUs is used.
+
+        Returns
+        -------
+        list
+            A dict with the results of each run
+        """
+        # Forking a process that has started threads, e.g. by JAX or numba, can deadlock
+        pool = multiprocessing.get_context("spawn").Pool(processes=n_jobs)
+        try:
+            results = pool.map(partial(_run_one, solver_cls=cls, kwargs=kwargs,
+                                       num_iterations=num_iterations),
+                               range(n_seeds))
+        finally:
+            pool.close()
+            pool.join()
+
+        return results
+
     def choose_next(self, X=None, y=None, do_optimize=True):
         """
         Suggests a new point to evaluate.
@@ -222,6 +390,8 @@ class BayesianOptimization(BaseSolver):
             Suggested point
         """
 
+        self._acquisition_value = None
+
         if X is None and y is None:
             x = self.initial_design(self.lower, self.upper, 1, rng=self.rng)[0, :]
 
@@ -232,19 +402,26 @@ class BayesianOptimization(BaseSolver):
         else:
             try:
                 logger.info("Train model...")
-                t = time.time()
-                self.model.train(X, y, do_optimize=do_optimize)
-                logger.info("Time to train the model: %f", (time.time() - t))
+                t = time.perf_counter()
+                # Models expect double precision, this is a no-op if the
+                # observations are already stored as float64
+                self.model.train(np.asarray(X, dtype=np.float64),
+                                 np.asarray(y, dtype=np.float64),
+                                 do_optimize=do_optimize)
+                logger.info("Time to train the model: %f", (time.perf_counter() - t))
             except:
                 logger.error("Model could not be trained!")
                 raise
             self.acquisition_func.update(self.model)
 
             logger.info("Maximize acquisition function...")
-            t = time.time()
+            t = time.perf_counter()
             x = self.maximize_func.maximize()
 
-            logger.info("Time to maximize the acquisition function: %f", (time.time() - t))
+            logger.info("Time to maximize the acquisition function: %f", (time.perf_counter() - t))
+            logger.info("Acquisition value of the candidate: %s", self.maximize_func.best_value)
+            if self.maximize_func.best_value is not None:
+                self._acquisition_value = float(self.maximize_func.best_value)
 
         return x
 
@@ -254,9 +431,14 @@ class BayesianOptimization(BaseSolver):
         data["optimization_overhead"] = self.time_overhead[it]
         data["runtime"] = self.runtime[it]
         data["incumbent"] = self.incumbents[it]
-        data["incumbents_value"] = self.incumbents_values[it]
+        data["incumbents_value"] = float(self.incumbents_values[it])
         data["time_func_eval"] = self.time_func_evals[it]
         data["iteration"] = it
 
+        hypers = self.model.get_hyperparameters()
+        data["hyperparameters"] = None if hypers is None else hypers.tolist()
+        # None for the points of the initial design
+        data["acquisition_value"] = self._acquisition_value
+
         json.dump(data, open(os.path.join(self.output_path, "robo_iter_%d.json" % it), "w"))
 
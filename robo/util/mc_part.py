@@ -43,7 +43,7 @@ def joint_pmin(m, V, Nf):
                 noise *= 10
 
     if noise > 0:
-        logger.error("Add %f noise on the diagonal." % noise)
+        logger.error("Add %f noise on the diagonal.", noise)
     # Draw new function samples from the innovated GP
     # on the representer points
     F = np.random.multivariate_normal(mean=np.zeros(Nb), cov=np.eye(Nb), size=Nf)
@@ -6,7 +6,74 @@ from scipy import optimize
 from robo.initial_design.init_random_uniform import init_random_uniform
 
 
-def posterior_mean_optimization(model, lower, upper, n_restarts=10, method="scipy", with_gradients=False):
+def _batched_local_search(f, startpoints, lower, upper, f_and_df=None, eps=1e-8):
+    """
+    Runs the local searches from all start points as one L-BFGS-B
+    optimization in the (N * D) dimensional space with the objective
+    g(x_1, ..., x_N) = sum_i f(x_i). This way each step of the optimizer
+    needs only a single batched call of the model for all start points.
+
+    Parameters
+    ----------
+    f : function
+        Maps the points np.ndarray(N, D) to their function values np.ndarray(N,)
+    startpoints : np.ndarray(N, D)
+        Start points of the local searches
+    lower : (D) numpy array
+        Specified the lower bound of the input space.
+    upper : (D) numpy array
+        Specified the upper bound of the input space.
+    f_and_df : function
+        Maps the points np.ndarray(N, D) to their function values np.ndarray(N,)
+        and their gradients np.ndarray(N, D), such that both can share one
+        prediction of the model. If None the gradients are approximated by finite
+        differences. Since g is separable, each dimension is perturbed in all start
+        points at once, which costs D + 1 calls of f per gradient.
+    eps : float
+        Step size of the finite differences
+
+    Returns
+    -------
+    np.ndarray(N, D)
+        the local optimum of each start point
+    np.ndarray(N,)
+        the corresponding function values
+    """
+    n_starts, n_dims = startpoints.shape
+
+    # Function values of the last evaluated points
+    last = dict()
+
+    def g(z):
+        X = z.reshape(n_starts, n_dims)
+        if f_and_df is not None:
+            fval, grad = f_and_df(X)
+            fval = np.ravel(fval)
+        else:
+            fval = np.ravel(f(X))
+            grad = np.zeros([n_starts, n_dims])
+            for j in range(n_dims):
+                step = np.where(X[:, j] + eps > upper[j], -eps, eps)
+                X_step = np.array(X)
+                X_step[:, j] += step
+                grad[:, j] = (np.ravel(f(X_step)) - fval) / step
+        last["z"] = np.array(z)
+        last["fval"] = fval
+        return np.sum(fval), grad.reshape(-1)
+
+    bounds = list(zip(np.tile(lower, n_starts), np.tile(upper, n_starts)))
+    res = optimize.minimize(g, startpoints.reshape(-1), jac=True,
+                            bounds=bounds, method="L-BFGS-B")
+    x_opt = res["x"].reshape(n_starts, n_dims)
+
+    # L-BFGS-B usually returns the last evaluated point, whose values we already know
+    if np.array_equal(res["x"], last.get("z")):
+        return x_opt, last["fval"]
+    return x_opt, np.ravel(f(x_opt))
+
+
+def posterior_mean_optimization(model, lower, upper, n_restarts=10, method="scipy", with_gradients=False,
+                                batched=True):
     """
     Estimates the incumbent by minimize the posterior
     mean of the objective function.
@@ -29,6 +96,10 @@ def posterior_mean_optimization(model, lower, upper, n_restarts=10, method="scip
     with_gradients : bool
         Specifies if gradient information are used. Only valid
         if method == 'scipy'.
+    batched : bool
+        If true and method == 'scipy' all restarts are optimized jointly
+        such that the model is called only once per step for all start points.
+        Otherwise the restarts are optimized one after another.
 
     Returns
     -------
@@ -43,18 +114,30 @@ def posterior_mean_optimization(model, lower, upper, n_restarts=10, method="scip
         dmu = model.predictive_gradients(x[np.newaxis, :])[0]
         return dmu
 
+    def f_batch(X):
+        return model.predict(X)[0]
+
+    def f_and_df_batch(X):
+        return model.predict(X)[0], model.predictive_gradients(X)[0].reshape(X.shape)
+
     startpoints = init_random_uniform(lower, upper, n_restarts)
 
+    if method == "scipy" and batched:
+        x_opt, fval = _batched_local_search(f_batch, startpoints, lower, upper,
+                                            f_and_df=f_and_df_batch if with_gradients else None)
+        return x_opt[np.argmin(fval)]
+
+    bounds = list(zip(lower, upper))
     x_opt = np.zeros([len(startpoints), lower.shape[0]])
     fval = np.zeros([len(startpoints)])
     for i, startpoint in enumerate(startpoints):
         if method == "scipy":
             if with_gradients:
-                res = optimize.fmin_l_bfgs_b(f, startpoint, df, bounds=list(zip(lower, upper)))
+                res = optimize.fmin_l_bfgs_b(f, startpoint, df, bounds=bounds)
                 x_opt[i] = res[0]
                 fval[i] = res[1]
             else:
-                res = optimize.minimize(f, startpoint, bounds=list(zip(lower, upper)), method="L-BFGS-B")
+                res = optimize.minimize(f, startpoint, bounds=bounds, method="L-BFGS-B")
                 x_opt[i] = res["x"]
                 fval[i] = res["fun"]
         elif method == 'cma':
@@ -67,7 +150,8 @@ def posterior_mean_optimization(model, lower, upper, n_restarts=10, method="scip
     return x_opt[best]
 
 
-def posterior_mean_plus_std_optimization(model, lower, upper, n_restarts=10, method="scipy", with_gradients=False):
+def posterior_mean_plus_std_optimization(model, lower, upper, n_restarts=10, method="scipy", with_gradients=False,
+                                         batched=True):
     """
     Estimates the incumbent by minimize the posterior mean + std of the objective function, i.e. the
     upper bound.
@@ -90,6 +174,10 @@ def posterior_mean_plus_std_optimization(model, lower, upper, n_restarts=10, met
     with_gradients : bool
         Specifies if gradient information are used. Only valid
         if method == 'scipy'.
+    batched : bool
+        If true and method == 'scipy' all restarts are optimized jointly
+        such that the model is called only once per step for all start points.
+        Otherwise the restarts are optimized one after another.
 
     Returns
     -------
@@ -111,18 +199,36 @@ def posterior_mean_plus_std_optimization(model, lower, upper, n_restarts=10, met
         dstd = 0.5 * dvar / std
         return dmu[:, :, 0] + dstd
 
+    def f_batch(X):
+        mu, var = model.predict(X)
+        return mu + np.sqrt(var)
+
+    def f_and_df_batch(X):
+        mu, var = model.predict(X)
+        dmu, dvar = model.predictive_gradients(X)
+        std = np.sqrt(var)
+        # Reuse the predicted variance for the chain rule of the standard deviation
+        dstd = 0.5 * dvar / std[:, None]
+        return mu + std, dmu[:, :, 0] + dstd
+
     startpoints = init_random_uniform(lower, upper, n_restarts)
 
+    if method == "scipy" and batched:
+        x_opt, fval = _batched_local_search(f_batch, startpoints, lower, upper,
+                                            f_and_df=f_and_df_batch if with_gradients else None)
+        return x_opt[np.argmin(fval)]
+
+    bounds = list(zip(lower, upper))
     x_opt = np.zeros([len(startpoints), lower.shape[0]])
     fval = np.zeros([len(startpoints)])
     for i, startpoint in enumerate(startpoints):
         if method == "scipy":
             if with_gradients:
-                res = optimize.fmin_l_bfgs_b(f, startpoint, df, bounds=list(zip(lower, upper)))
+                res = optimize.fmin_l_bfgs_b(f, startpoint, df, bounds=bounds)
                 x_opt[i] = res[0]
                 fval[i] = res[1]
             else:
-                res = optimize.minimize(f, startpoint, bounds=list(zip(lower, upper)), method="L-BFGS-B")
+                res = optimize.minimize(f, startpoint, bounds=bounds, method="L-BFGS-B")
                 x_opt[i] = res["x"]
                 fval[i] = res["fun"]
         elif method == 'cma':
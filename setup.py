@@ -22,7 +22,10 @@ optional_dependencies = [
     'theano',
     'lasagne',
     'sgmcmc',
-    'pymatbridge'
+    'pymatbridge',
+    'greenlet',
+    'numba',
+    'jax'
     ]
 
 opt_dependency_links = {
@@ -21,6 +21,23 @@ class DemoModel(BaseModel):
         pass
 
 
+class DemoSolverModel(DemoModel):
+    """
+    DemoModel that records the arguments of each call of train
+    """
+
+    def __init__(self):
+        super(DemoSolverModel, self).__init__()
+        self.do_optimize = []
+        self.train_dtypes = []
+
+    @BaseModel._check_shapes_train
+    def train(self, X, y, do_optimize=True):
+        self.do_optimize.append(do_optimize)
+        self.train_dtypes.append((X.dtype, y.dtype))
+        super(DemoSolverModel, self).train(X, y)
+
+
 class DemoQuadraticModel(BaseModel):
 
     @BaseModel._check_shapes_predict
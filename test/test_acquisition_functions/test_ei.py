@@ -1,7 +1,7 @@
 import unittest
 import numpy as np
 
-from robo.acquisition_functions.ei import EI
+from robo.acquisition_functions.ei import EI, _expected_improvement, _expected_improvement_numpy
 
 from test.dummy_model import DemoModel
 
@@ -22,5 +22,37 @@ class TestEI(unittest.TestCase):
         assert a.shape[0] == X_test.shape[0]
         assert len(a.shape) == 1
 
+    def test_expected_improvement(self):
+        m = np.random.randn(20)
+        s = np.random.rand(20) + 0.1
+        np.testing.assert_almost_equal(_expected_improvement(m, s, 0.5),
+                                       _expected_improvement_numpy(m, s, 0.5))
+
+    def test_expected_improvement_tail(self):
+        # Means far above the incumbent value
+        m = np.linspace(0, 40, 10001)
+        s = np.ones(m.shape[0])
+        f = _expected_improvement(m, s, 0.0)
+        assert np.all(f >= 0)
+        np.testing.assert_almost_equal(f, _expected_improvement_numpy(m, s, 0.0))
+    def test_compute_zero_variance(self):
+        # Batches of points where only some points have no uncertainty
+        class ZeroVarianceModel(DemoModel):
+            def predict(self, X_test):
+                m, v = super(ZeroVarianceModel, self).predict(X_test)
+                v[::2] = 0
+                return m, v
+
+        model = ZeroVarianceModel()
+        model.train(self.X, self.y)
+        ei = EI(model)
+
+        X_test = np.random.rand(6, 2)
+        a = ei.compute(X_test, derivative=False)
+        assert a.shape[0] == X_test.shape[0]
+        assert np.all(a[::2] == 0)
+        np.testing.assert_almost_equal(a[1::2], EI(self.model).compute(X_test[1::2]))
+
+
 if __name__ == "__main__":
     unittest.main()
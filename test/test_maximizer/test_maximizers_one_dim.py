@@ -5,6 +5,7 @@ import numpy as np
 from robo.maximizers.direct import Direct
 from robo.maximizers.grid_search import GridSearch
 from robo.maximizers.random_sampling import RandomSampling
+from robo.maximizers.batched_random_sampling import BatchedRandomSampling
 from robo.maximizers.scipy_optimizer import SciPyOptimizer
 from robo.acquisition_functions.base_acquisition import BaseAcquisitionFunction
 from test.dummy_model import DemoQuadraticModel
@@ -59,6 +60,17 @@ class TestMaximizers1D(unittest.TestCase):
         assert np.all(x >= self.lower)
         assert np.all(x <= self.upper)
 
+    def test_batched_random_sampling(self):
+        maximizer = BatchedRandomSampling(self.objective_function, self.lower, self.upper,
+                                          n_samples=1000, batch_size=300)
+        x = maximizer.maximize()
+
+        assert x.shape[0] == 1
+        assert len(x.shape) == 1
+        assert np.all(x >= self.lower)
+        assert np.all(x <= self.upper)
+        assert maximizer.best_value == np.max(self.objective_function(x[None, :]))
+
     def test_scipy(self):
         maximizer = SciPyOptimizer(self.objective_function, self.lower, self.upper)
         x = maximizer.maximize()
@@ -68,5 +80,15 @@ class TestMaximizers1D(unittest.TestCase):
         assert np.all(x >= self.lower)
         assert np.all(x <= self.upper)
 
+    def test_scipy_sobol(self):
+        maximizer = SciPyOptimizer(self.objective_function, self.lower, self.upper,
+                                   start_points="sobol")
+        x = maximizer.maximize()
+
+        assert x.shape[0] == 1
+        assert len(x.shape) == 1
+        assert np.all(x >= self.lower)
+        assert np.all(x <= self.upper)
+
 if __name__ == "__main__":
     unittest.main()
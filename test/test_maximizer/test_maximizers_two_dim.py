@@ -5,6 +5,8 @@ import numpy as np
 from robo.maximizers.cmaes import CMAES
 from robo.maximizers.direct import Direct
 from robo.maximizers.random_sampling import RandomSampling
+from robo.maximizers.batched_random_sampling import BatchedRandomSampling
+from robo.maximizers import scipy_optimizer
 from robo.maximizers.scipy_optimizer import SciPyOptimizer
 from robo.acquisition_functions.base_acquisition import BaseAcquisitionFunction
 from test.dummy_model import DemoQuadraticModel
@@ -24,6 +26,17 @@ class DemoAcquisitionFunction(BaseAcquisitionFunction):
         return np.array([y])
 
 
+class RecordingAcquisitionFunction(DemoAcquisitionFunction):
+
+    def __init__(self):
+        super(RecordingAcquisitionFunction, self).__init__()
+        self.n_rows = []
+
+    def compute(self, x, **kwargs):
+        self.n_rows.append(x.shape[0])
+        return super(RecordingAcquisitionFunction, self).compute(x, **kwargs)
+
+
 class TestMaximizers2D(unittest.TestCase):
 
     def setUp(self):
@@ -59,6 +72,17 @@ class TestMaximizers2D(unittest.TestCase):
         assert np.all(x >= self.lower)
         assert np.all(x <= self.upper)
 
+    def test_batched_random_sampling(self):
+        maximizer = BatchedRandomSampling(self.objective_function, self.lower, self.upper,
+                                          n_samples=1000, batch_size=300)
+        x = maximizer.maximize()
+
+        assert x.shape[0] == 2
+        assert len(x.shape) == 1
+        assert np.all(x >= self.lower)
+        assert np.all(x <= self.upper)
+        assert maximizer.best_value == np.max(self.objective_function(x[None, :]))
+
     def test_scipy(self):
         maximizer = SciPyOptimizer(self.objective_function, self.lower, self.upper)
         x = maximizer.maximize()
@@ -68,6 +92,43 @@ class TestMaximizers2D(unittest.TestCase):
         assert np.all(x >= self.lower)
         assert np.all(x <= self.upper)
 
+    def test_scipy_sobol(self):
+        maximizer = SciPyOptimizer(self.objective_function, self.lower, self.upper,
+                                   start_points="sobol")
+        x = maximizer.maximize()
+
+        assert x.shape[0] == 2
+        assert len(x.shape) == 1
+        assert np.all(x >= self.lower)
+        assert np.all(x <= self.upper)
+
+    def test_scipy_batched_local_searches(self):
+        if scipy_optimizer.greenlet is None:
+            self.skipTest("greenlet is not installed")
+
+        acq = RecordingAcquisitionFunction()
+        maximizer = SciPyOptimizer(acq, self.lower, self.upper, rng=np.random.RandomState(1))
+        np.random.seed(1)
+        x_batched = maximizer.maximize()
+        value_batched = maximizer.best_value
+
+        # All running local searches are evaluated with one call
+        assert max(acq.n_rows) > 1
+
+        scipy_optimizer.greenlet, greenlet = None, scipy_optimizer.greenlet
+        try:
+            acq.n_rows = []
+            maximizer = SciPyOptimizer(acq, self.lower, self.upper, rng=np.random.RandomState(1))
+            np.random.seed(1)
+            x_serial = maximizer.maximize()
+            value_serial = maximizer.best_value
+        finally:
+            scipy_optimizer.greenlet = greenlet
+
+        assert max(acq.n_rows) == 1
+        np.testing.assert_almost_equal(x_batched, x_serial, decimal=5)
+        np.testing.assert_almost_equal(value_batched, value_serial, decimal=5)
+
 
 if __name__ == "__main__":
     unittest.main()
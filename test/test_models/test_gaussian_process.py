@@ -73,6 +73,11 @@ class TestGaussianProcess(unittest.TestCase):
         # Hyperparameters are 2 length scales + noise
         assert theta.shape[0] == 3
 
+    def test_get_hyperparameters(self):
+        hypers = self.model.get_hyperparameters()
+        assert len(hypers.shape) == 1
+        assert hypers.shape[0] == 3
+
     def test_get_incumbent(self):
         inc, inc_val = self.model.get_incumbent()
 
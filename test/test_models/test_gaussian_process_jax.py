@@ -0,0 +1,109 @@
+import unittest
+import numpy as np
+import scipy.linalg as spla
+
+from robo.models.gaussian_process_jax import GaussianProcessJax, _matern52
+from robo.priors.default_priors import DefaultPrior, TophatPrior
+
+
+class TestGaussianProcessJax(unittest.TestCase):
+
+    def setUp(self):
+        self.X = np.random.rand(10, 2)
+        self.y = np.sinc(self.X * 10 - 5).sum(axis=1)
+
+        prior = TophatPrior(-2, 2)
+        self.model = GaussianProcessJax(np.ones(self.X.shape[1]), prior=prior,
+                                        normalize_input=False,
+                                        normalize_output=False)
+        self.model.train(self.X, self.y, do_optimize=False)
+
+    def test_predict(self):
+        X_test = np.random.rand(10, 2)
+
+        m, v = self.model.predict(X_test)
+
+        assert len(m.shape) == 1
+        assert m.shape[0] == X_test.shape[0]
+        assert len(v.shape) == 1
+        assert v.shape[0] == X_test.shape[0]
+
+        m, v = self.model.predict(X_test, full_cov=True)
+
+        assert len(m.shape) == 1
+        assert m.shape[0] == X_test.shape[0]
+        assert len(v.shape) == 2
+        assert v.shape[0] == X_test.shape[0]
+        assert v.shape[1] == X_test.shape[0]
+
+        theta = self.model.hypers
+        K_zz = _matern52(theta, X_test, X_test)
+        K_zx = _matern52(theta, X_test, self.X)
+        K_nz = _matern52(theta, self.X, self.X) + self.model.noise * np.eye(self.X.shape[0])
+        inv = spla.inv(K_nz)
+        K_zz_x = K_zz - np.dot(K_zx, np.inner(inv, K_zx))
+        assert np.mean((K_zz_x - v)**2) < 10e-5
+
+    def test_sample_function(self):
+        X_test = np.random.rand(8, 2)
+        n_funcs = 3
+        funcs = self.model.sample_functions(X_test, n_funcs=n_funcs)
+
+        assert len(funcs.shape) == 2
+        assert funcs.shape[0] == n_funcs
+        assert funcs.shape[1] == X_test.shape[0]
+
+    def test_predict_variance(self):
+        x_test1 = np.random.rand(1, 2)
+        x_test2 = np.random.rand(10, 2)
+        var = self.model.predict_variance(x_test1, x_test2)
+        assert len(var.shape) == 2
+        assert var.shape[0] == x_test2.shape[0]
+        assert var.shape[1] == x_test1.shape[0]
+
+    def test_nll(self):
+        theta = np.array([0.2, 0.2, 0.2, np.log(0.001)])
+        nll, grad = self.model.nll(theta)
+
+        assert grad.shape[0] == theta.shape[0]
+        eps = 1e-6
+        for i in range(theta.shape[0]):
+            theta_eps = np.array(theta)
+            theta_eps[i] += eps
+            np.testing.assert_almost_equal((self.model.nll(theta_eps)[0] - nll) / eps, grad[i], decimal=3)
+
+    def test_nll_default_prior(self):
+        # The gradient of the default prior is not implemented, the gradient
+        # of the negative log likelihood has to account for it nevertheless
+        model = GaussianProcessJax(np.ones(self.X.shape[1]), prior=DefaultPrior(4),
+                                   normalize_input=False,
+                                   normalize_output=False)
+        model.train(self.X, self.y, do_optimize=False)
+
+        theta = np.array([0.2, 0.2, 0.2, np.log(0.001)])
+        nll, grad = model.nll(theta)
+        eps = 1e-6
+        for i in range(theta.shape[0]):
+            theta_eps = np.array(theta)
+            theta_eps[i] += eps
+            np.testing.assert_almost_equal((model.nll(theta_eps)[0] - nll) / eps, grad[i], decimal=3)
+
+    def test_optimize(self):
+        theta = self.model.optimize()
+        # Hyperparameters are the amplitude, 2 length scales + noise
+        assert theta.shape[0] == 4
+
+    def test_get_hyperparameters(self):
+        hypers = self.model.get_hyperparameters()
+        assert len(hypers.shape) == 1
+        assert hypers.shape[0] == 4
+
+    def test_get_incumbent(self):
+        inc, inc_val = self.model.get_incumbent()
+
+        b = np.argmin(self.y)
+        np.testing.assert_almost_equal(inc, self.X[b], decimal=5)
+        assert inc_val == self.y[b]
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,8 +22,9 @@ class TestBayesianOptimization(unittest.TestCase):
         model = GaussianProcess(kernel)
         lcb = LCB(model)
         maximizer = Direct(lcb, lower, upper, n_func_evals=10)
-        self.solver = BayesianOptimization(objective_func, lower, upper,
-                                           lcb, model, maximizer)
+        self.kwargs = dict(objective_func=objective_func, lower=lower, upper=upper,
+                           acquisition_func=lcb, model=model, maximize_func=maximizer)
+        self.solver = BayesianOptimization(**self.kwargs)
 
     def test_run(self):
         n_iters = 4
@@ -40,6 +41,17 @@ class TestBayesianOptimization(unittest.TestCase):
         assert self.solver.X.shape[0] == n_iters
         assert self.solver.y.shape[0] == n_iters
 
+    def test_run_parallel(self):
+        n_seeds = 2
+        n_iters = 4
+        results = BayesianOptimization.run_parallel(n_seeds, n_iters, self.kwargs, n_jobs=2)
+
+        assert len(results) == n_seeds
+        for res in results:
+            assert len(res["incumbents"]) == n_iters
+            assert len(res["incumbent_values"]) == n_iters
+            assert res["f_opt"] == np.min(res["incumbent_values"])
+
     def test_choose_next(self):
         X = np.random.rand(10, 1)
         y = np.array([objective_func(x) for x in X])
@@ -0,0 +1,217 @@
+import os
+import copy
+import json
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from robo.acquisition_functions.ei import EI
+from robo.acquisition_functions.lcb import LCB
+from robo.maximizers.base_maximizer import BaseMaximizer
+from robo.maximizers.random_sampling import RandomSampling
+from robo.solver.bayesian_optimization import BayesianOptimization, _reseed
+from test.dummy_model import DemoSolverModel
+
+
+def objective_func(x):
+    return np.sum((x - 0.5) ** 2)
+
+
+def objective_func_array(x):
+    # Returns the function value as an array with a single entry
+    return np.array([np.sum((x - 0.5) ** 2)])
+
+
+class BatchObjective(object):
+    """
+    Objective that evaluates all points of the initial design in one call
+    """
+    supports_batch = True
+
+    def __init__(self):
+        self.n_calls = 0
+        self.n_batch_calls = 0
+        # Number of values that are returned for a batch, None returns one per point
+        self.n_batch_values = None
+
+    def __call__(self, x):
+        self.n_calls += 1
+        if x.ndim == 2:
+            self.n_batch_calls += 1
+            return np.sum((x - 0.5) ** 2, axis=1)[:self.n_batch_values]
+        return objective_func(x)
+
+
+class FixedPointMaximizer(BaseMaximizer):
+    """
+    Always suggests the center of the input space
+    """
+
+    def maximize(self):
+        x = (self.lower + self.upper) / 2
+        self.best_value = self.objective_func(x[np.newaxis, :])[0]
+        return x
+
+
+class TestBayesianOptimizationDemoModel(unittest.TestCase):
+
+    def setUp(self):
+        self.lower = np.zeros([2])
+        self.upper = np.ones([2])
+        self.model = DemoSolverModel()
+        lcb = LCB(self.model)
+        maximizer = RandomSampling(lcb, self.lower, self.upper, n_samples=100)
+        self.kwargs = dict(lower=self.lower, upper=self.upper,
+                           acquisition_func=lcb, model=self.model, maximize_func=maximizer,
+                           rng=np.random.RandomState(1))
+
+    def test_run_array_objective(self):
+        n_iters = 5
+        solver = BayesianOptimization(objective_func=objective_func_array, **self.kwargs)
+        inc, inc_val = solver.run(n_iters)
+
+        assert len(inc) == 2
+        assert solver.y.shape == (n_iters,)
+        assert np.allclose(solver.y, [objective_func(x) for x in solver.X])
+        assert inc_val == np.min(solver.y)
+
+    def test_incumbents_are_copies(self):
+        n_iters = 5
+        solver = BayesianOptimization(objective_func=objective_func, **self.kwargs)
+        solver.run(n_iters)
+
+        assert len(solver.incumbents) == n_iters
+        for i in range(1, n_iters):
+            assert solver.incumbents[i] is not solver.incumbents[i - 1]
+
+    def test_run_batch_initial_design(self):
+        n_init = 3
+        n_iters = 5
+        objective = BatchObjective()
+        solver = BayesianOptimization(objective_func=objective, initial_points=n_init, **self.kwargs)
+        solver.run(n_iters)
+
+        # One call for the initial design and one for each iteration
+        assert objective.n_batch_calls == 1
+        assert objective.n_calls == 1 + n_iters - n_init
+        assert len(solver.time_func_evals) == n_iters
+        assert len(solver.time_overhead) == n_iters
+        assert len(solver.incumbents) == n_iters
+        assert len(solver.incumbents_values) == n_iters
+        assert np.allclose(solver.y, [objective_func(x) for x in solver.X])
+
+    def test_run_float32(self):
+        n_iters = 5
+        output_path = tempfile.mkdtemp()
+        try:
+            solver = BayesianOptimization(objective_func=objective_func, use_float32=True,
+                                          output_path=output_path, **self.kwargs)
+            inc, inc_val = solver.run(n_iters)
+
+            assert solver.X.dtype == np.float32
+            assert solver.y.dtype == np.float32
+            # The model is always trained in double precision
+            assert len(self.model.train_dtypes) > 0
+            for X_dtype, y_dtype in self.model.train_dtypes:
+                assert X_dtype == np.float64
+                assert y_dtype == np.float64
+
+            # The incumbent is an evaluated point, not its rounded copy
+            assert isinstance(inc_val, float)
+            assert objective_func(np.array(inc)) == inc_val
+            assert solver.incumbents_values[-1] == inc_val
+
+            for it in range(n_iters):
+                with open(os.path.join(output_path, "robo_iter_%d.json" % it)) as fh:
+                    data = json.load(fh)
+                assert data["iteration"] == it
+                assert len(data["incumbent"]) == 2
+                if it < solver.init_points:
+                    assert data["acquisition_value"] is None
+                else:
+                    assert isinstance(data["acquisition_value"], float)
+        finally:
+            shutil.rmtree(output_path)
+
+    def test_skip_optimization_after_duplicate(self):
+        n_init = 3
+        n_iters = 6
+        self.kwargs["maximize_func"] = FixedPointMaximizer(self.kwargs["acquisition_func"],
+                                                           self.lower, self.upper)
+        solver = BayesianOptimization(objective_func=objective_func, initial_points=n_init, **self.kwargs)
+        solver.run(n_iters)
+
+        # The center is evaluated in every iteration, from the second time on
+        # the last point is a duplicate and the hyperparameters are not optimized
+        assert self.model.do_optimize == [True, True, False]
+
+    def test_no_duplicate_threshold(self):
+        n_init = 3
+        n_iters = 6
+        self.kwargs["maximize_func"] = FixedPointMaximizer(self.kwargs["acquisition_func"],
+                                                           self.lower, self.upper)
+        solver = BayesianOptimization(objective_func=objective_func, initial_points=n_init,
+                                      duplicate_threshold=0, **self.kwargs)
+        solver.run(n_iters)
+
+        assert self.model.do_optimize == [True, True, True]
+
+    def test_reseed_nested(self):
+        self.model.prior = [np.random.RandomState(0)]
+        kwargs1 = self.kwargs
+        kwargs2 = copy.deepcopy(self.kwargs)
+        _reseed(kwargs1, np.random.RandomState(1))
+        _reseed(kwargs2, np.random.RandomState(2))
+
+        # Generators of nested components are reseeded as well
+        assert kwargs1["model"].prior[0].rand() != kwargs2["model"].prior[0].rand()
+        assert kwargs1["maximize_func"].rng.rand() != kwargs2["maximize_func"].rng.rand()
+
+    def test_run_parallel(self):
+        n_seeds = 2
+        n_iters = 4
+        # The random number generator of each run is created from its seed
+        del self.kwargs["rng"]
+        self.kwargs["objective_func"] = objective_func
+        results = BayesianOptimization.run_parallel(n_seeds, n_iters, self.kwargs, n_jobs=2)
+
+        assert len(results) == n_seeds
+        for res in results:
+            assert len(res["incumbents"]) == n_iters
+            assert res["f_opt"] == np.min(res["incumbent_values"])
+        assert results[0]["incumbents"][0] != results[1]["incumbents"][0]
+
+    def test_run_batch_wrong_length(self):
+        objective = BatchObjective()
+        objective.n_batch_values = 2
+        solver = BayesianOptimization(objective_func=objective, initial_points=3, **self.kwargs)
+        self.assertRaises(ValueError, solver.run, 5)
+
+    def test_run_parallel_after_compiled_code(self):
+        # Compiled code that ran in the parent process, e.g. the numba kernel
+        # of EI or the likelihood of the JAX GP, starts threads which must
+        # not be inherited by the worker processes
+        X = np.random.rand(5, 2)
+        y = np.array([objective_func(x) for x in X])
+        self.model.train(X, y)
+        ei = EI(self.model)
+        ei.compute(X)
+
+        try:
+            from robo.models.gaussian_process_jax import GaussianProcessJax
+        except ValueError:
+            pass
+        else:
+            GaussianProcessJax(np.ones(2)).train(X, y)
+
+        kwargs = dict(objective_func=objective_func, lower=self.lower, upper=self.upper,
+                      acquisition_func=ei, model=self.model,
+                      maximize_func=RandomSampling(ei, self.lower, self.upper, n_samples=100))
+        results = BayesianOptimization.run_parallel(2, 4, kwargs, n_jobs=2)
+
+        assert len(results) == 2
+
+
+if __name__ == "__main__":
+    unittest.main()